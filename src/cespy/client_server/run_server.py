@@ -4,23 +4,16 @@
 
 import argparse
 import logging
+import signal
 import sys
-import time
-from typing import Any, Optional, Type
+import threading
+from typing import Any, Type
 
 from cespy.client_server.sim_server import SimServer
 from cespy.simulators.ltspice_simulator import LTspice
 from cespy.simulators.ngspice_simulator import NGspiceSimulator
 from cespy.simulators.xyce_simulator import XyceSimulator
 
-keyboard: Optional[Any] = None
-try:
-    import keyboard
-except ImportError:
-    # keyboard module is optional and only needed for interactive
-    # server control
-    pass
-
 
 def main() -> None:
     """Run the main SPICE server with command-line arguments."""
@@ -91,12 +84,20 @@ def main() -> None:
         timeout=args.timeout,
         port=args.port,
     )
-    print("Server Started. Press and hold 'q' to stop")
-    while server.running():
-        time.sleep(0.2)
-        if keyboard and keyboard.is_pressed("q"):
-            server.stop_server()
-            break
+    stop_requested = threading.Event()
+
+    def request_stop(*_: Any) -> None:
+        stop_requested.set()
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+    print("Server Started. Press Ctrl+C to stop")
+    # The timeout is only there to notice when the server is stopped by a client,
+    # through the stop_server() call.
+    while server.running() and not stop_requested.wait(timeout=1.0):
+        pass
+    if server.running():
+        server.stop_server()
 
 
 if __name__ == "__main__":
@@ -31,19 +31,77 @@ import logging
 # Created:     23-02-2023
 # Licence:     refer to the LICENSE file
 # --------------------------------------------------------------
-import os.path
 import pathlib
 import sys
 import time
 import zipfile
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from dataclasses import dataclass
+from stat import S_ISREG
 from typing import Iterable, cast
 from xmlrpc.client import Binary, Fault, ServerProxy
 
 _logger = logging.getLogger("cespy.SimClient")
 
 
+# Files up to this size are stored in the zip files without compression, as
+# deflating them costs more time than it saves on the transfer.
+_ZIP_STORED_MAX_SIZE = 4096
+# Files which are already compressed, or which barely compress, like the binary
+# floating point data of .raw files
+_COMPRESSED_SUFFIXES = (".zip", ".gz", ".bz2", ".xz", ".7z", ".raw")
+
+
+def _write_to_zip(zip_file: zipfile.ZipFile, path: pathlib.Path, arcname: str) -> bool:
+    """Internal function.
+
+    Writes a file into the zip file. Small and already compressed files are stored
+    without compression. Returns False if the file can't be read.
+    """
+    try:
+        file_stat = path.stat()
+        if not S_ISREG(file_stat.st_mode):
+            return False  # Directories and other special files can't be sent
+        if (
+            file_stat.st_size <= _ZIP_STORED_MAX_SIZE
+            or path.suffix.lower() in _COMPRESSED_SUFFIXES
+        ):
+            compress_type = zipfile.ZIP_STORED
+        else:
+            compress_type = zipfile.ZIP_DEFLATED
+        zip_file.write(path, arcname, compress_type=compress_type)
+    except OSError:
+        return False
+    return True
+
+
+def _zip_payload(
+    files: Iterable[tuple[pathlib.Path, str]],
+    *,
+    first_required: bool = False,
+) -> bytes | None:
+    """Internal function.
+
+    Creates in memory the zip file that is sent to the server. Each element of files
+    is a (path, name inside the zip) tuple. Files that can't be read are skipped, unless
+    first_required is set and it is the first file that can't be read. In that case,
+    None is returned without reading the other files.
+    """
+    # Create a buffer to store the zip file in memory
+    zip_buffer = io.BytesIO()
+
+    # Create the zip file in memory
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for index, (path, arcname) in enumerate(files):
+            if _write_to_zip(zip_file, path, arcname):
+                continue
+            if index == 0 and first_required:
+                return None
+            _logger.warning("Client: Skipping %s, as it can't be read", path)
+
+    return zip_buffer.getvalue()
+
+
 class SimClientInvalidRunId(LookupError):
     """Raised when asking for a run_no that doesn't exist."""
 
@@ -128,6 +186,21 @@ class SimClient:
                 # Normally the raw file comes first
                 zipf.extract(zipf.namelist()[0])
 
+        server.close_session()
+
+    The session is not closed when the object is garbage collected, so
+    close_session() must be called when the client is no longer needed.
+    The client can also be used as a context manager, which closes the session on
+    exit. A single client, and thus a single session and connection, should be
+    reused for all the jobs sent to the same server:
+
+    .. code-block:: python
+
+        with SimClient('http://localhost', 9000) as server:
+            runids = [server.run(netlist) for netlist in netlists]
+            for runid in server:
+                server.get_runno_data(runid)
+
     NOTE: More elaborate algorithms such as managing multiple servers
     will be done on another class.
     """
@@ -136,20 +209,31 @@ class SimClient:
         self.server: ServerProxy = ServerProxy(f"{host_address}:{port}")
         raw_session_id = self.server.start_session()
         self.session_id: str = cast(str, raw_session_id)
+        self._session_closed = False
         _logger.info("Client: Started %s", self.session_id)
         # Started jobs pending retrieval
         self.started_jobs: OrderedDict[int, JobInformation] = OrderedDict()
         # This list keeps track of finished simulations that haven't yet been
         # transferred.
         self.stored_jobs: OrderedDict[int, JobInformation] = OrderedDict()
+        # Finished jobs reported by the server, which weren't yet returned by the
+        # iterator
+        self._finished_runnos: deque[int] = deque()
         self.completed_jobs = 0
         self.minimum_time_between_server_calls = (
             0.2  # Minimum time between server calls
         )
         self._last_server_call = time.time()
 
-    def __del__(self) -> None:
-        self.close_session()
+    def __enter__(self) -> SimClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        try:
+            self.close_session()
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Don't hide the exception that is leaving the with block, if any
+            _logger.debug("Client: Failed to close session", exc_info=True)
 
     def add_sources(self, sources: Iterable[str | pathlib.Path]) -> bool:
         """Add sources to the simulation environment.
@@ -159,21 +243,8 @@ class SimClient:
         the simulation folder. Returns True if the sources were added
         and False if the session_id is not valid.
         """
-        # Create a buffer to store the zip file in memory
-        zip_buffer = io.BytesIO()
-
-        # Create the zip file in memory
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            for source in sources:
-                dep_path = pathlib.Path(source)
-                if dep_path.exists():
-                    zip_file.write(source, dep_path.name)
-
-        # Reset the buffer position to the start
-        zip_buffer.seek(0)
-
-        # Read the zip file from the buffer and send it to the server
-        zip_data = zip_buffer.read()
+        source_paths = [pathlib.Path(source) for source in sources]
+        zip_data = _zip_payload((dep_path, dep_path.name) for dep_path in source_paths)
         try:
             raw_result = self.server.add_sources(self.session_id, zip_data)
             result: bool = cast(bool, raw_result)
@@ -215,33 +286,23 @@ class SimClient:
         """
         circuit_path = pathlib.Path(circuit)
         circuit_name = circuit_path.name
-        if os.path.exists(circuit):
-            # Create a buffer to store the zip file in memory
-            zip_buffer = io.BytesIO()
-
-            # Create the zip file in memory
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                # Write circuit to root of the zipfile
-                zip_file.write(circuit, circuit_name)
-                if dependencies is not None:
-                    for dep in dependencies:
-                        dep_path = pathlib.Path(dep)
-                        if dep_path.exists():
-                            zip_file.write(dep, dep_path.name)
-
-            # Reset the buffer position to the start
-            zip_buffer.seek(0)
-
-            # Read the zip file from the buffer and send it to the server
-            zip_data = zip_buffer.read()
-
-            raw_run_id = self.server.run(self.session_id, circuit_name, zip_data)
-            run_id: int = cast(int, raw_run_id)
-            job_info = JobInformation(run_number=run_id, file_dir=circuit_path.parent)
-            self.started_jobs[run_id] = job_info
-            return run_id
-        _logger.error("Client: Circuit %s doesn't exit", circuit)
-        return -1
+        # Circuit goes to the root of the zipfile
+        payload = [(circuit_path, circuit_name)]
+        if dependencies is not None:
+            for dep in dependencies:
+                dep_path = pathlib.Path(dep)
+                payload.append((dep_path, dep_path.name))
+        # The circuit is checked before any of the dependencies is read
+        zip_data = _zip_payload(payload, first_required=True)
+        if zip_data is None:
+            _logger.error("Client: Circuit %s doesn't exit", circuit)
+            return -1
+
+        raw_run_id = self.server.run(self.session_id, circuit_name, zip_data)
+        run_id: int = cast(int, raw_run_id)
+        job_info = JobInformation(run_number=run_id, file_dir=circuit_path.parent)
+        self.started_jobs[run_id] = job_info
+        return run_id
 
     def get_runno_data(self, runno: int) -> pathlib.Path | None:
         """Returns the simulation output data inside a zip file name.
@@ -270,10 +331,17 @@ class SimClient:
 
     def __next__(self) -> int:
         while len(self.started_jobs) > 0:
-            raw_status = self.server.status(self.session_id)
-            status: list[int] = cast(list[int], raw_status)
-            if len(status) > 0:
-                runno: int = status.pop(0)
+            if not self._finished_runnos:
+                raw_status = self.server.status(self.session_id)
+                status: list[int] = cast(list[int], raw_status)
+                # All the finished jobs are kept, so that the server is only
+                # called again after all of them were returned. Jobs already
+                # stored, but not yet retrieved, are also in the status list.
+                self._finished_runnos.extend(
+                    runno for runno in status if runno in self.started_jobs
+                )
+            if self._finished_runnos:
+                runno: int = self._finished_runnos.popleft()
                 # Job is taken out of the started jobs list
                 # and is added to the stored jobs
                 self.stored_jobs[runno] = self.started_jobs.pop(runno)
@@ -291,8 +359,11 @@ class SimClient:
 
     def close_session(self) -> None:
         """Close the session with the simulation server."""
+        if self._session_closed:
+            return
         _logger.info("Client: Closing session %s", self.session_id)
         self.server.close_session(self.session_id)
+        self._session_closed = True
 
 
 def main() -> None:  # pylint: disable=too-many-nested-blocks
@@ -315,7 +386,8 @@ def main() -> None:  # pylint: disable=too-many-nested-blocks
     parser.add_argument(
         "-r",
         "--run",
-        help="Path to circuit file to simulate",
+        nargs="+",
+        help="Path to circuit file(s) to simulate",
         metavar="CIRCUIT",
     )
     parser.add_argument(
@@ -343,35 +415,41 @@ def main() -> None:  # pylint: disable=too-many-nested-blocks
 
     try:
         # Create client and connect to server
-        client = SimClient(f"http://{args.host}", args.port)
-        print(f"Connected to server at {args.host}:{args.port}")
-        print(f"Session ID: {client.session_id}")
-
-        if not args.run:
-            print("Connected successfully. Use -r option to run a simulation.")
-            client.close_session()
-            return
-
-        # Run a simulation if circuit file was provided
-        run_id = client.run(args.run, args.dependencies)
-        if run_id < 0:
-            print("Failed to start simulation")
-            sys.exit(1)
-
-        print(f"Started simulation with run ID: {run_id}")
-
-        # Wait for completion and download results
-        for completed_id in client:
-            if completed_id != run_id:
-                continue
-            result_path = client.get_runno_data(completed_id)
-            if result_path:
-                print(f"Results saved to: {result_path}")
-            else:
-                print("Simulation failed or no results available")
-            break
-
-        client.close_session()
+        with SimClient(f"http://{args.host}", args.port) as client:
+            print(f"Connected to server at {args.host}:{args.port}")
+            print(f"Session ID: {client.session_id}")
+
+            if not args.run:
+                print("Connected successfully. Use -r option to run a simulation.")
+                return
+
+            # All the circuits are sent first, so that the server runs them in
+            # parallel, while the results are downloaded as they finish. A failed
+            # simulation doesn't stop the others, but is reported in the exit code.
+            failed = False
+            for circuit in args.run:
+                run_id = client.run(circuit, args.dependencies)
+                if run_id < 0:
+                    print(f"Failed to start simulation of {circuit}")
+                    failed = True
+                    continue
+                print(f"Started simulation of {circuit} with run ID: {run_id}")
+
+            # Wait for completion and download results
+            for completed_id in client:
+                try:
+                    result_path = client.get_runno_data(completed_id)
+                except (Fault, OSError) as e:
+                    print(f"Failed to retrieve results of run ID {completed_id}: {e}")
+                    failed = True
+                    continue
+                if result_path:
+                    print(f"Results of run ID {completed_id} saved to: {result_path}")
+                else:
+                    print(f"Simulation {completed_id} failed or no results available")
+                    failed = True
+            if failed:
+                sys.exit(1)
 
     except Exception as e:  # pylint: disable=broad-exception-caught
         _logger.error("Error: %s", e)
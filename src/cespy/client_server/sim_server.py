@@ -10,10 +10,11 @@ compressed format.
 
 import io
 import logging
+import secrets
 import threading
-import uuid
 import zipfile
 from pathlib import Path
+from socketserver import ThreadingMixIn
 from typing import List, Tuple, Type
 from xmlrpc.client import Binary
 from xmlrpc.server import SimpleXMLRPCServer
@@ -24,6 +25,14 @@ from cespy.sim.simulator import Simulator
 _logger = logging.getLogger("cespy.SimServer")
 
 
+class ThreadingXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
+    """XML-RPC server that handles each request on its own thread, so that a long
+    transfer or a simulation waiting for a free slot doesn't hold back the status and
+    result requests of the other clients."""
+
+    daemon_threads = True
+
+
 class SimServer:
     """This class implements a server that can run simulations by
     request of a client located in a different machine.
@@ -63,6 +72,7 @@ class SimServer:
         host: str = "localhost",
     ) -> None:
         self.output_folder = output_folder
+        self._output_path = Path(output_folder)
         self.simulation_manager: ServerSimRunner = ServerSimRunner(
             parallel_sims=parallel_sims,
             timeout=timeout,
@@ -70,7 +80,7 @@ class SimServer:
             output_folder=output_folder,
             simulator=simulator,
         )
-        self.server = SimpleXMLRPCServer(
+        self.server = ThreadingXMLRPCServer(
             (host, port),
             # requestHandler=RequestHandler
         )
@@ -78,7 +88,13 @@ class SimServer:
         self.server.register_instance(self)
         # this will contain the session_id ids hashing their
         # respective list of sim_tasks
-        self.sessions: dict[str, list[int]] = {}
+        self.sessions: dict[str, set[int]] = {}
+        # Requests are served on several threads. This lock protects the sessions
+        self._lock = threading.RLock()
+        # All sessions extract their files into the same output folder. This lock is
+        # held from the extraction until the runner took its copy of the circuit, so
+        # that an upload from another request can't overwrite the files in between.
+        self._submit_lock = threading.RLock()
         self.simulation_manager.start()
         self.server_thread = threading.Thread(
             target=self.server.serve_forever, name="ServerThread"
@@ -93,20 +109,19 @@ class SimServer:
         False if the session_id is not valid.
         """
         _logger.info("Server: Add sources %s", session_id)
-        if session_id not in self.sessions:
-            return False  # This indicates that no job is started
+        with self._lock:
+            if session_id not in self.sessions:
+                return False  # This indicates that no job is started
         # Create a buffer from the zip data
         zip_buffer = io.BytesIO(zip_data.data)
         _logger.debug("Server: Created the buffer")
         # Extract the contents of the zip file
-        answer = False
-        with zipfile.ZipFile(zip_buffer, "r") as zip_file:
-            for name in zip_file.namelist():
-                _logger.debug("Server: Writing %s to zip file", name)
-            if len(zip_file.namelist()) >= 0:
-                zip_file.extractall(self.output_folder)
-                answer = True
-        return answer
+        with self._submit_lock, zipfile.ZipFile(zip_buffer, "r") as zip_file:
+            if _logger.isEnabledFor(logging.DEBUG):
+                for info in zip_file.infolist():
+                    _logger.debug("Server: Writing %s to zip file", info.filename)
+            zip_file.extractall(self._output_path)
+        return True
 
     def run(self, session_id: str, circuit_name: str, zip_data: Binary) -> int:
         """Run a simulation for the given session.
@@ -120,15 +135,23 @@ class SimServer:
             The run number of the simulation or -1 if failed
         """
         _logger.info("Server: Run %s : %s", session_id, circuit_name)
-        if not self.add_sources(session_id, zip_data):
+        circuit_path = self._output_path / circuit_name
+        with self._submit_lock:
+            if not self.add_sources(session_id, zip_data):
+                return -1
+            _logger.info("Server: Running simulation of %s", circuit_path)
+            runno = self.simulation_manager.add_simulation(circuit_path)
+        if runno == -1:
             return -1
-
-        circuit_path = Path(self.output_folder) / circuit_name
-        _logger.info("Server: Running simulation of %s", circuit_path)
-        runno = self.simulation_manager.add_simulation(circuit_path)
-        if runno != -1:
-            self.sessions[session_id].append(runno)
-        return runno
+        with self._lock:
+            session_runnos = self.sessions.get(session_id)
+            if session_runnos is not None:
+                session_runnos.add(runno)
+                return runno
+        # The session was closed in the meantime, so nobody will collect the results
+        _logger.info("Server: Session %s closed, discarding run %s", session_id, runno)
+        self.simulation_manager.erase_files_of_runno(runno)
+        return -1
 
     def start_session(self) -> str:
         """Returns an unique key that represents the session.
@@ -137,9 +160,10 @@ class SimServer:
         """
         # Needs to be a string, otherwise the rpc client can't
         # handle it
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_hex(16)
         _logger.info("Server: Starting session %s", session_id)
-        self.sessions[session_id] = []
+        with self._lock:
+            self.sessions[session_id] = set()
         return session_id
 
     def status(self, session_id: str) -> List[int]:
@@ -156,15 +180,15 @@ class SimServer:
         * 'stop' - server time
         """
         _logger.debug("Server: collecting status for %s", session_id)
-        ret = []
-        for task_info in self.simulation_manager.completed_tasks:
-            _logger.debug(task_info)
-            runno = task_info["runno"]
-            if runno in self.sessions[session_id]:
-                # transfers the dictionary from the simulation_manager
-                # completed task
-                ret.append(runno)
-                # to the return dictionary
+        with self._lock:
+            session_runnos = self.sessions[session_id].copy()
+        # runnos of the completed tasks of this session, in order of completion
+        # (a copy of the keys is taken, as tasks complete on another thread)
+        ret = [
+            runno
+            for runno in list(self.simulation_manager.completed_tasks)
+            if runno in session_runnos
+        ]
         _logger.debug("Server: Returning status %s", ret)
         return ret
 
@@ -176,31 +200,41 @@ class SimServer:
             runno: The run number to retrieve files for
 
         Returns:
-            Tuple of (filename, binary_data) or empty values if not found
+            Tuple of (filename, binary_data) or empty values if not found, or if the
+            simulation failed
         """
-        if runno in self.sessions[session_id]:
-            for task_info in self.simulation_manager.completed_tasks:
-                if runno == task_info["runno"]:
-                    # Create a buffer to store the zip file in memory
-                    zip_file = task_info["zipfile"]
-                    zip_handle = zip_file.open("rb")
-                    # Read the zip file from the buffer and send it to the
-                    # server
-                    zip_data = zip_handle.read()
-                    zip_handle.close()
-                    self.simulation_manager.erase_files_of_runno(runno)
-                    return zip_file.name, Binary(zip_data)
-
-        return "", Binary(b"")  # Returns and empty data
+        with self._lock:
+            session_runnos = self.sessions.get(session_id)
+            task_info = self.simulation_manager.completed_tasks.get(runno)
+            if session_runnos is None or runno not in session_runnos:
+                task_info = None
+            elif task_info is not None:
+                # The files can only be retrieved once
+                session_runnos.discard(runno)
+        if task_info is None:
+            return "", Binary(b"")  # Returns and empty data
+        try:
+            zip_file = task_info.zipfile
+            if zip_file is None:  # The simulation failed, so there are no results
+                return "", Binary(b"")
+            # Read the zip file and send it to the client
+            with zip_file.open("rb") as zip_handle:
+                zip_data = zip_handle.read()
+            return zip_file.name, Binary(zip_data)
+        finally:
+            # The runno is no longer in the session, so the files are erased here,
+            # whether they could be sent or not
+            self.simulation_manager.erase_files_of_runno(runno)
 
     def close_session(self, session_id: str) -> bool:
         """Cleans all the pending sim_tasks with."""
-        if session_id not in self.sessions:
+        with self._lock:
+            session_runnos = self.sessions.pop(session_id, None)
+        if session_runnos is None:
             return False
         _logger.info("Closing session %s", session_id)
-        for runno in self.sessions[session_id]:
+        for runno in session_runnos:
             self.simulation_manager.erase_files_of_runno(runno)
-        del self.sessions[session_id]
         return True  # Needs to return always something. None is not supported
 
     def stop_server(self) -> bool:
@@ -28,10 +28,9 @@ import logging
 # Licence:     refer to the LICENSE file
 # --------------------------------------------------------------
 import threading
-import time
 import zipfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, NamedTuple, Optional, Set, Union
 
 from ..editor.base_editor import BaseEditor
 from ..sim.sim_runner import SimRunner
@@ -51,11 +50,26 @@ def zip_files(raw_filename: Path, log_filename: Path) -> Path:
     """
     zip_filename = raw_filename.with_suffix(".zip")
     with zipfile.ZipFile(zip_filename, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        zip_file.write(raw_filename)
+        # The raw file is stored without compression: it is mostly binary floating
+        # point data, on which deflate spends a lot of time for a small gain.
+        zip_file.write(raw_filename, compress_type=zipfile.ZIP_STORED)
         zip_file.write(log_filename)
     return zip_filename
 
 
+class CompletedTask(NamedTuple):
+    """Information kept by the server about a finished simulation."""
+
+    runno: int
+    retcode: int
+    circuit: Path
+    raw: Optional[Path]
+    log: Optional[Path]
+    zipfile: Optional[Path]  # None when the simulation failed
+    start: Optional[float]
+    stop: Optional[float]
+
+
 class ServerSimRunner(threading.Thread):
     """This class maintains updated status of the SimRunner. It was
     decided not to make SimRunner a super class and rather make it
@@ -88,10 +102,16 @@ class ServerSimRunner(threading.Thread):
             verbose=verbose,
             output_folder=output_folder,
         )
-        # This is a list of dictionaries with the information of
-        # the completed tasks
-        self.completed_tasks: List[Dict[str, Any]] = []
-        self._stop = False
+        # Information of the completed tasks, indexed by runno, in order of completion
+        self.completed_tasks: Dict[int, CompletedTask] = {}
+        # Tasks whose files are to be erased as soon as they complete
+        self._erase_on_completion: Set[int] = set()
+        # Guards completed_tasks and _erase_on_completion, which are changed by this
+        # thread and by the threads serving the requests
+        self._lock = threading.Lock()
+        self._stop_requested = False
+        # Set when a simulation finishes, or when the thread is asked to stop
+        self._wakeup = threading.Event()
 
     def run(self) -> None:
         """This function makes a direct manipulation of the
@@ -100,31 +120,50 @@ class ServerSimRunner(threading.Thread):
         This option is
         """
         while True:
+            # Cleared before collecting the finished tasks, so that a task finishing
+            # in the meantime isn't missed.
+            self._wakeup.clear()
             self.runner.update_completed()
             # Access tasks attribute if it exists
             tasks_attr = getattr(self.runner, 'tasks', None)
             if tasks_attr and hasattr(tasks_attr, 'completed_tasks'):
-                while len(tasks_attr.completed_tasks) > 0:
-                    task = tasks_attr.completed_tasks.pop(0)
+                # Takes all the finished tasks at once, instead of popping them
+                # one by one from the front of the list. The lock keeps request
+                # threads from collecting tasks in the meantime.
+                with tasks_attr.lock:
+                    finished_tasks = tasks_attr.completed_tasks[:]
+                    tasks_attr.completed_tasks.clear()
+                for task in finished_tasks:
                     zip_filename = task.callback_return
-                    self.completed_tasks.append(
-                        {
-                            "runno": task.runno,
-                            "retcode": task.retcode,
-                            "circuit": task.netlist_file,
-                            "raw": task.raw_file,
-                            "log": task.log_file,
-                            "zipfile": zip_filename,
-                            "start": task.start_time,
-                            "stop": task.stop_time,
-                        }
+                    completed = CompletedTask(
+                        runno=task.runno,
+                        retcode=task.retcode,
+                        circuit=task.netlist_file,
+                        raw=task.raw_file,
+                        log=task.log_file,
+                        zipfile=zip_filename,
+                        start=task.start_time,
+                        stop=task.stop_time,
                     )
-                    _logger.debug("Task %s is finished", task)
-                    _logger.debug(self.completed_tasks[-1])
-                    _logger.debug(len(self.completed_tasks))
-
-            time.sleep(0.2)
-            if self._stop is True:
+                    with self._lock:
+                        erase = task.runno in self._erase_on_completion
+                        if erase:
+                            self._erase_on_completion.discard(task.runno)
+                        else:
+                            self.completed_tasks[task.runno] = completed
+                    if erase:
+                        self._erase_files(completed)
+                    elif _logger.isEnabledFor(logging.DEBUG):
+                        _logger.debug(
+                            "Task %s is finished: %s (%d completed tasks)",
+                            task,
+                            completed,
+                            len(self.completed_tasks),
+                        )
+
+            # The timeout is only a safeguard, as finished tasks set the event
+            self._wakeup.wait(timeout=1.0)
+            if self._stop_requested is True:
                 break
         self.runner.wait_completion()
         # Delete things that have been left behind
@@ -157,37 +196,55 @@ class ServerSimRunner(threading.Thread):
         if task is None:
             _logger.error("Failed to start task %s", netlist)
             return -1
+        with self.runner.tasks.lock:
+            future = next(
+                (f for t, f in self.runner.tasks.active_tasks if t is task), None
+            )
+        if future is None:  # Already finished and collected
+            self._wakeup.set()
+        else:
+            future.add_done_callback(lambda _: self._wakeup.set())
         _logger.info("Started task %s with job_id%s", netlist, task.runno)
         return int(task.runno)
 
-    def _erase_files_and_info(self, pos: int) -> None:
-        task = self.completed_tasks[pos]
-        for filename in ("circuit", "log", "raw", "zipfile"):
-            f = task[filename]
-            if f.exists():
-                _logger.info("deleting %s", f)
+    @staticmethod
+    def _erase_files(task: CompletedTask) -> None:
+        for f in (task.circuit, task.log, task.raw, task.zipfile):
+            if f is None:
+                continue
+            try:
                 f.unlink()
-        del self.completed_tasks[pos]
+            except FileNotFoundError:
+                continue
+            _logger.info("deleted %s", f)
 
     def erase_files_of_runno(self, runno: int) -> None:
-        """Will delete all files related with a completed task.
+        """Will delete all files related with a task. If the task didn't complete yet,
+        its files are deleted as soon as it completes.
 
         Will also delete information on the completed_tasks attribute.
         """
-        for i, task_info in enumerate(self.completed_tasks):
-            if task_info["runno"] == runno:
-                self._erase_files_and_info(i)
-                break
+        with self._lock:
+            task = self.completed_tasks.pop(runno, None)
+            if task is None:
+                self._erase_on_completion.add(runno)
+        if task is not None:
+            self._erase_files(task)
 
     def cleanup_completed(self) -> None:
         """Clean up all completed tasks and their associated files."""
-        while self.completed_tasks:
-            self._erase_files_and_info(0)
+        while True:
+            with self._lock:
+                if not self.completed_tasks:
+                    break
+                task = self.completed_tasks.popitem()[1]
+            self._erase_files(task)
 
     def stop(self) -> None:
         """Signal the thread to stop running."""
         _logger.info("stopping...ServerSimRunner")
-        self._stop = True
+        self._stop_requested = True
+        self._wakeup.set()
 
     def running(self) -> bool:
         """Check if the thread is still running.
@@ -195,4 +252,4 @@ class ServerSimRunner(threading.Thread):
         Returns:
             True if the thread is running, False otherwise
         """
-        return self._stop is False
+        return self._stop_requested is False
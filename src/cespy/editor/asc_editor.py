@@ -907,6 +907,10 @@ class AscEditor(BaseSchematic):
         self.directives.append(directive)
         self.updated = True
 
+    def has_instruction(self, instruction: str) -> bool:
+        # docstring inherited from BaseEditor
+        return any(instruction in directive.text for directive in self.directives)
+
     def remove_instruction(self, instruction: str) -> None:
         i = 0
         while i < len(self.directives):
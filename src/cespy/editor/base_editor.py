@@ -804,6 +804,17 @@ class BaseEditor(ABC):
         :returns: Nothing
         """
 
+    @abstractmethod
+    def has_instruction(self, instruction: str) -> bool:
+        """Checks whether a SPICE instruction is in the netlist. The instruction is
+        matched in the same way as in remove_instruction().
+
+        :param instruction: The instruction to look for
+        :type instruction: str
+        :returns: True if the instruction is in the netlist
+        :rtype: bool
+        """
+
     @abstractmethod
     def remove_x_instruction(self, search_pattern: str) -> None:
         """Removes a SPICE instruction from the netlist based on a search pattern. This
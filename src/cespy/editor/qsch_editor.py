@@ -1209,6 +1209,16 @@ class QschEditor(BaseSchematic):
         if self.schematic is not None:
             self.schematic.items.append(tag)
 
+    def has_instruction(self, instruction: str) -> bool:
+        # docstring inherited from BaseEditor
+        if self.schematic is None:
+            return False
+        for text_tag in self.schematic.get_items("text"):
+            text = text_tag.get_attr(QSCH_TEXT_STR_ATTR)
+            if isinstance(text, str) and instruction in text:
+                return True
+        return False
+
     def remove_instruction(self, instruction: str) -> None:
         # docstring inherited from BaseEditor
         if self.schematic is None:
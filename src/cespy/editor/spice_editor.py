@@ -42,6 +42,7 @@ Example:
 """
 from __future__ import annotations
 
+import io
 import logging
 import os
 import re
@@ -1374,6 +1375,12 @@ class SpiceCircuit(BaseEditor):
                 index = len(self.netlist) - 2
             self.netlist.insert(index, instruction)
 
+    def has_instruction(self, instruction: str) -> bool:
+        # docstring is in the parent class
+        if not instruction.endswith(END_LINE_TERM):
+            instruction += END_LINE_TERM
+        return instruction in self.netlist
+
     def remove_instruction(self, instruction: str) -> None:
         # docstring is in the parent class
 
@@ -1668,23 +1675,30 @@ class SpiceEditor(SpiceCircuit):
         if isinstance(run_netlist_file, str):
             run_netlist_file = Path(run_netlist_file)
 
-        with open(run_netlist_file, "w", encoding=self.encoding) as f:
-            lines = iter(self.netlist)
-            for line in lines:
-                if isinstance(line, SpiceCircuit):
-                    # pylint: disable=protected-access
-                    line._write_lines(f)
-                    # pylint: enable=protected-access
-                else:
-                    # Writes the modified sub-circuits at the end just before the .END
-                    # clause
-                    if line.upper().startswith(".END"):
-                        # write here the modified sub-circuits
-                        for sub in self.modified_subcircuits.values():
-                            # pylint: disable=protected-access
-                            sub._write_lines(f)
-                            # pylint: enable=protected-access
-                    f.write(line)
+        # The netlist is rendered in memory first and then written with a single call,
+        # instead of issuing one small write per netlist line.
+        buffer = io.StringIO()
+        for line in self.netlist:
+            if isinstance(line, SpiceCircuit):
+                # pylint: disable=protected-access
+                line._write_lines(buffer)
+                # pylint: enable=protected-access
+            else:
+                # Writes the modified sub-circuits at the end just before the .END
+                # clause
+                if line.upper().startswith(".END"):
+                    # write here the modified sub-circuits
+                    for sub in self.modified_subcircuits.values():
+                        # pylint: disable=protected-access
+                        sub._write_lines(buffer)
+                        # pylint: enable=protected-access
+                buffer.write(line)
+
+        text = buffer.getvalue()
+        if os.linesep != "\n":
+            # Keep the platform line endings that a text mode write would produce
+            text = text.replace("\n", os.linesep)
+        run_netlist_file.write_bytes(text.encode(self.encoding))
 
     def reset_netlist(self, create_blank: bool = False) -> None:
         """Removes all previous edits done to the netlist, i.e. resets it to the
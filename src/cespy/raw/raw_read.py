@@ -287,6 +287,10 @@ def _safe_eval(expr: str, variables: Dict[str, Any]) -> Any:
 
 _logger = logging.getLogger("cespy.RawRead")
 
+# Read buffer used on RAW files. Non fast access files are read a few bytes at a
+# time, so a large buffer considerably reduces the number of read system calls.
+RAW_READ_BUFFER_SIZE = 1 << 20
+
 
 def read_float64(f: IO[bytes]) -> float:
     """Reads a 64-bit float value, normally associated with the plot X axis. The
@@ -483,7 +487,13 @@ class RawRead:
         raw_file_size = os.stat(
             raw_filename_path
         ).st_size  # Get the file size in order to know the data size
-        raw_file = open(raw_filename_path, "rb")
+        raw_file = open(raw_filename_path, "rb", buffering=RAW_READ_BUFFER_SIZE)
+        if hasattr(os, "posix_fadvise"):
+            # The file is read from start to end. Let the kernel read ahead.
+            try:
+                os.posix_fadvise(raw_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # Only a hint, some file systems don't support it
 
         ch = raw_file.read(6)
         if ch.decode(encoding="utf_8") == "Title:":
@@ -100,7 +100,6 @@ terminated just after the simulation is finished.
 __author__ = "Nuno Canto Brum <nuno.brum@gmail.com>"
 __copyright__ = "Copyright 2020, Fribourg Switzerland"
 
-import inspect
 import logging
 import os
 from pathlib import Path
@@ -109,7 +108,7 @@ from typing import Any, Callable, Optional, Type, Union
 from ..editor.spice_editor import SpiceEditor
 from ..simulators.ltspice_simulator import LTspice
 from .process_callback import ProcessCallback
-from .sim_runner import SimRunner
+from .sim_runner import SimRunner, callback_parameters
 from .simulator import Simulator
 
 _logger = logging.getLogger("cespy.SimBatch")
@@ -260,9 +259,7 @@ class SimCommander(SpiceEditor):
             elif callable(callback):
                 # Check if the callback expects string parameters (legacy)
                 # If so, adapt it to accept Path objects
-                sig = inspect.signature(callback)
-                params = list(sig.parameters.values())
-                if len(params) >= 2:
+                if len(callback_parameters(callback)) >= 2:
                     # Create a wrapper that ensures Path objects are passed
                     def adapted_callback_wrapper(raw_file: Path, log_file: Path) -> Any:
                         # Convert Path objects to strings for legacy callbacks
@@ -113,6 +113,7 @@ __all__ = [
     "ProcessCallback",
     "RunTask",
     "clock_function",
+    "callback_parameters",
 ]
 
 import concurrent.futures
@@ -120,10 +121,11 @@ import inspect  # Library used to get the arguments of the callback function
 import logging
 import shutil
 import sys
+import threading
+import weakref
 from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from time import sleep
 from time import thread_time as clock
 from typing import (
     Any,
@@ -158,6 +160,40 @@ CallbackType = Union[
 ]
 
 
+# Signatures of the callback functions already inspected. The functions are weakly
+# referenced, so that the cache doesn't keep them, or the objects they belong to, alive.
+_callback_signatures: weakref.WeakKeyDictionary[
+    Callable[..., Any], inspect.Signature
+] = weakref.WeakKeyDictionary()
+
+
+def callback_parameters(callback: Callable[..., Any]) -> Tuple[str, ...]:
+    """Returns the names of the parameters of a callback, as they are passed to it.
+
+    The signature of each function is only inspected once. Bound methods are looked up
+    by their underlying function, so that their instances aren't kept by the cache.
+    """
+    func = getattr(callback, "__func__", callback)
+    try:
+        sig = _callback_signatures.get(func)
+    except TypeError:  # Unhashable callable objects cannot be cached
+        return tuple(inspect.signature(callback).parameters)
+    if sig is None:
+        sig = inspect.signature(func)
+        try:
+            _callback_signatures[func] = sig
+        except TypeError:  # Nor can objects that don't support weak references
+            pass
+    params = tuple(sig.parameters.values())
+    if func is not callback and params and params[0].kind in (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        # The first parameter of a bound method (self or cls) is already bound
+        params = params[1:]
+    return tuple(param.name for param in params)
+
+
 @dataclass
 class SimRunnerConfig:
     """Configuration class for SimRunner initialization.
@@ -200,6 +236,9 @@ class TaskManager:
     """Groups task management related attributes."""
     active_tasks: List[Tuple[RunTask, Future[RunTask]]] = field(default_factory=list)
     completed_tasks: List[RunTask] = field(default_factory=list)
+    # Guards the task lists and the run counter, so that simulations can be started
+    # and collected from several threads.
+    lock: threading.RLock = field(default_factory=threading.RLock)
 
 
 class SimRunnerTimeoutError(TimeoutError):
@@ -472,9 +511,9 @@ class SimRunner(AnyRunner):
         if callback is None:
             return None  # No callback function, hence callback_args have no effect
         if inspect.isclass(callback) and issubclass(callback, ProcessCallback):
-            args = inspect.signature(callback.callback).parameters
+            args = callback_parameters(callback.callback)
         else:
-            args = inspect.signature(callback).parameters
+            args = callback_parameters(callback)
         if len(args) < 2:
             raise ValueError("Callback function must have at least two arguments")
         if len(args) > 2:
@@ -511,7 +550,7 @@ class SimRunner(AnyRunner):
         while clock() - t0 < timeout + 1:
             if not wait_resource or (self.active_threads() < self.parallel_sims):
                 return True
-            sleep(0.1)
+            self._wait_any_completed(0.1)
         _logger.error("Timeout waiting for resources for simulation %s", self.stats.run_count)
         return False
 
@@ -585,7 +624,9 @@ class SimRunner(AnyRunner):
         callback_kwargs = self.validate_callback_args(callback, callback_args)
         if switches is None:
             switches = []
-        run_netlist_file = self._prepare_sim(netlist, run_filename)
+        with self.tasks.lock:
+            run_netlist_file = self._prepare_sim(netlist, run_filename)
+            runno = self.stats.run_count
 
         if timeout is None:
             timeout = self.timeout
@@ -606,7 +647,7 @@ class SimRunner(AnyRunner):
         # Launch the simulation task via ThreadPoolExecutor
         t = RunTask(
             simulator=self.simulator,
-            runno=self.stats.run_count,
+            runno=runno,
             netlist_file=run_netlist_file,
             callback=actual_callback,
             callback_args=callback_kwargs,
@@ -616,7 +657,8 @@ class SimRunner(AnyRunner):
             exe_log=exe_log,
         )
         future = self._executor.submit(t)
-        self.tasks.active_tasks.append((t, future))
+        with self.tasks.lock:
+            self.tasks.active_tasks.append((t, future))
         _logger.debug(
             "RunTask submitted: runno=%d, netlist_file=%s",
             t.runno,
@@ -624,6 +666,54 @@ class SimRunner(AnyRunner):
         )
         return t
 
+    async def run_async(
+        self,
+        netlist: Union[str, Path, BaseEditor],
+        *,
+        callback: Optional[CallbackType] = None,
+        callback_args: Optional[Union[tuple[Any, ...], dict[str, Any]]] = None,
+        switches: Optional[List[str]] = None,
+        timeout: Optional[float] = None,
+        run_filename: Optional[str] = None,
+        exe_log: bool = False,
+    ) -> Optional[RunTask]:
+        """Coroutine version of :meth:`run`. The simulation is scheduled right away
+        and the coroutine finishes when the simulation (and callback) is completed.
+
+        Unlike :meth:`run`, this method never blocks waiting for a free slot. All the
+        simulations are handed to the executor, which runs at most ``parallel_sims``
+        of them at the same time, while the event loop stays free. This allows
+        launching many simulations at once, for example:
+
+        .. code-block:: python
+
+            tasks = await asyncio.gather(*(runner.run_async(n) for n in netlists))
+
+        See :meth:`run` for the description of the parameters.
+
+        :returns: The completed RunTask object, or None if it couldn't be started.
+        """
+        # Imported here, as asyncio is slow to import and only needed by this method
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        task = self.run(
+            netlist,
+            wait_resource=False,
+            callback=callback,
+            callback_args=callback_args,
+            switches=switches,
+            timeout=timeout,
+            run_filename=run_filename,
+            exe_log=exe_log,
+        )
+        if task is None:
+            return None
+        with self.tasks.lock:
+            future = next((f for t, f in self.tasks.active_tasks if t is task), None)
+        if future is None:  # Already finished and collected by another thread
+            return task
+        return await asyncio.wrap_future(future)
+
     def run_now(
         self,
         netlist: Union[str, Path, BaseEditor],
@@ -664,7 +754,9 @@ class SimRunner(AnyRunner):
             timeout,
             exe_log,
         )
-        run_netlist_file = self._prepare_sim(netlist, run_filename)
+        with self.tasks.lock:
+            run_netlist_file = self._prepare_sim(netlist, run_filename)
+            runno = self.stats.run_count
 
         cmdline_switches = (
             switches or self.cmdline_switches
@@ -681,7 +773,7 @@ class SimRunner(AnyRunner):
 
         t = RunTask(
             simulator=self.simulator,
-            runno=self.stats.run_count,
+            runno=runno,
             netlist_file=run_netlist_file,
             callback=dummy_callback,
             callback_args=None,
@@ -698,12 +790,13 @@ class SimRunner(AnyRunner):
             t.raw_file,
             t.log_file,
         )
-        self.tasks.completed_tasks.append(t)
-        if t.retcode == 0:
-            self.stats.successful_simulations += 1
-        else:
-            # simulation failed
-            self.stats.failed_simulations += 1
+        with self.tasks.lock:
+            self.tasks.completed_tasks.append(t)
+            if t.retcode == 0:
+                self.stats.successful_simulations += 1
+            else:
+                # simulation failed
+                self.stats.failed_simulations += 1
         return t.raw_file, t.log_file  # Returns the raw and log file
 
     def active_threads(self) -> int:
@@ -726,23 +819,24 @@ class SimRunner(AnyRunner):
             len(self.tasks.active_tasks),
             len(self.tasks.completed_tasks),
         )
-        i = 0
-        while i < len(self.tasks.active_tasks):
-            task, future = self.tasks.active_tasks[i]
-            if not future.done():
-                i += 1
-            else:
-                if task.retcode == 0:
-                    self.stats.successful_simulations += 1
+        with self.tasks.lock:
+            i = 0
+            while i < len(self.tasks.active_tasks):
+                task, future = self.tasks.active_tasks[i]
+                if not future.done():
+                    i += 1
                 else:
-                    self.stats.failed_simulations += 1
-                self.tasks.active_tasks.pop(i)
-                self.tasks.completed_tasks.append(task)
-                _logger.debug(
-                    "Task %d moved from active to completed (retcode=%d)",
-                    task.runno,
-                    task.retcode,
-                )
+                    if task.retcode == 0:
+                        self.stats.successful_simulations += 1
+                    else:
+                        self.stats.failed_simulations += 1
+                    self.tasks.active_tasks.pop(i)
+                    self.tasks.completed_tasks.append(task)
+                    _logger.debug(
+                        "Task %d moved from active to completed (retcode=%d)",
+                        task.runno,
+                        task.retcode,
+                    )
 
     def kill_all_ltspice(self) -> None:
         """.. deprecated:: 1.0 Use `kill_all_spice()` instead.
@@ -761,11 +855,33 @@ class SimRunner(AnyRunner):
             _logger.error("psutil library not installed, cannot kill processes")
             return
 
-        for proc in psutil.process_iter():
+        # Ask psutil to fetch only the process name, in a single pass, rather than
+        # querying each process object separately.
+        for proc in psutil.process_iter(["name"]):
             # check whether the process name matches
-            if proc.name() == process_name:
+            if proc.info["name"] == process_name:
                 _logger.info("killing Spice %s", proc.pid)
-                proc.kill()
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass
+
+    def _wait_any_completed(self, timeout: float) -> None:
+        """Blocks until at least one active task finishes or the timeout expires.
+
+        Waiting on the futures directly lets the caller react as soon as a simulation
+        completes, instead of sleeping a fixed polling interval per active task.
+
+        :param timeout: Maximum time to block, in seconds.
+        :type timeout: float
+        :return: Nothing
+        """
+        with self.tasks.lock:
+            futures = [future for _, future in self.tasks.active_tasks]
+        if futures:
+            concurrent.futures.wait(
+                futures, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
 
     def _maximum_stop_time(self) -> Optional[float]:
         """This function will return the maximum timeout time of all active tasks.
@@ -818,7 +934,7 @@ class SimRunner(AnyRunner):
         if timeout is not None:
             stop_time = clock_function() + timeout
         while len(self.tasks.active_tasks) > 0:
-            sleep(1)
+            self._wait_any_completed(1.0)
             self.update_completed()
             if timeout is None:
                 stop_time = self._maximum_stop_time()
@@ -841,9 +957,14 @@ class SimRunner(AnyRunner):
         :type workfile: Path
         :return: Nothing
         """
-        if workfile is not None and workfile.exists():
-            _logger.info("Deleting...%s", workfile.name)
+        if workfile is None:
+            return
+        # A single unlink() call instead of an exists() check followed by unlink()
+        try:
             workfile.unlink()
+        except FileNotFoundError:
+            return
+        _logger.info("Deleting...%s", workfile.name)
 
     @staticmethod
     def _del_file_ext_if_exists(workfile: Path, ext: str) -> None:
@@ -952,7 +1073,7 @@ class SimRunner(AnyRunner):
                 )
 
             # Wait for the active tasks to finish with a timeout
-            sleep(0.2)  # Go asleep for a while
+            self._wait_any_completed(0.2)
 
     def create_netlist(
         self,
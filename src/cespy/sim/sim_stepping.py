@@ -26,6 +26,7 @@
 __author__ = "Nuno Canto Brum <nuno.brum@gmail.com>"
 __copyright__ = "Copyright 2017, Fribourg Switzerland"
 
+import itertools
 import logging
 import sys
 from functools import wraps
@@ -72,7 +73,12 @@ class StepInfo:
         self.iter = iterable
 
     def __len__(self) -> int:
-        return len(list(self.iter))
+        try:
+            # Sequences and the sweep iterators know their length without having
+            # to generate all the values.
+            return len(self.iter)  # type: ignore[arg-type]
+        except TypeError:
+            return len(list(self.iter))
 
     def __str__(self) -> str:
         return f"Iteration on {self.what} {self.elem} : {self.iter}"
@@ -212,8 +218,19 @@ class SimStepper:
         timeout: Optional[float] = None,
         use_loadbias: str = "Auto",
         wait_completion: bool = True,
+        native_step: bool = False,
     ) -> None:
-        """Run all simulations defined by the sweeps."""
+        """Run all simulations defined by the sweeps.
+
+        :param native_step: If True, the parameter sweeps are not iterated by Python but
+            written to the netlist as ``.STEP PARAM <name> LIST ...`` instructions, so
+            that the simulator parses the circuit once and steps through all the values
+            in a single run. Only the component and model sweeps produce separate runs.
+            The simulator must support the ``.STEP`` instruction (LTspice, QSpice) and
+            at most three parameter sweeps can be stepped this way. The stepped
+            parameters should not be defined with ``.PARAM`` in the netlist.
+        :type native_step: bool, optional
+        """
         assert use_loadbias in (
             "Auto",
             "Yes",
@@ -225,41 +242,55 @@ class SimStepper:
             # Use .SAVEBIAS/.LOADBIAS if simulations > 10
             # TODO: Make a first simulation and storing the bias
             pass
-        iter_no = 0
-        iterators = [iter(step.iter) for step in self.iter_list]
-        while True:
-            while 0 <= iter_no < len(self.iter_list):
-                try:
-                    value = next(iterators[iter_no])
-                except StopIteration:
-                    iterators[iter_no] = iter(self.iter_list[iter_no].iter)
-                    iter_no -= 1
-                    continue
-                if self.iter_list[iter_no].what == "param":
-                    self.netlist.set_parameter(self.iter_list[iter_no].elem, value)
-                elif self.iter_list[iter_no].what == "component":
-                    self.netlist.set_component_value(
-                        self.iter_list[iter_no].elem, value
-                    )
-                elif self.iter_list[iter_no].what == "model":
-                    self.netlist.set_element_model(self.iter_list[iter_no].elem, value)
-                else:
-                    # TODO: develop other types of sweeps EX: add .STEP
-                    # instruction
-                    raise ValueError("Not Supported sweep")
-                iter_no += 1
-            if iter_no < 0:
-                break
-            self.runner.run(
-                self.netlist,
-                callback=callback,
-                callback_args=callback_args,
-                switches=switches,
-                timeout=timeout,
-            )  # Like this a recursion is avoided
-            iter_no = (
-                len(self.iter_list) - 1
-            )  # Resets the counter to start next iteration
+        step_instructions: List[str] = []
+        python_steps = self.iter_list
+        if native_step:
+            native_steps = [step for step in self.iter_list if step.what == "param"]
+            if len(native_steps) > 3:
+                raise ValueError("At most three parameters can be stepped natively")
+            python_steps = [step for step in self.iter_list if step.what != "param"]
+            step_instructions = [
+                f".step param {step.elem} list {' '.join(str(v) for v in step.iter)}"
+                for step in native_steps
+            ]
+            # Instructions that the netlist already has are neither added again nor
+            # removed afterwards, so that the user's own instructions are kept.
+            step_instructions = [
+                instruction
+                for instruction in step_instructions
+                if not self.netlist.has_instruction(instruction)
+            ]
+            self.netlist.add_instructions(*step_instructions)
+
+        try:
+            previous: Optional[Tuple[Any, ...]] = None
+            for values in itertools.product(*(step.iter for step in python_steps)):
+                for pos, (step, value) in enumerate(zip(python_steps, values)):
+                    # Only the dimensions that advanced since the last point are updated
+                    if previous is not None and previous[pos] is value:
+                        continue
+                    if step.what == "param":
+                        self.netlist.set_parameter(step.elem, value)
+                    elif step.what == "component":
+                        self.netlist.set_component_value(step.elem, value)
+                    elif step.what == "model":
+                        self.netlist.set_element_model(step.elem, value)
+                    else:
+                        # TODO: develop other types of sweeps
+                        raise ValueError("Not Supported sweep")
+                previous = values
+                self.runner.run(
+                    self.netlist,
+                    callback=callback,
+                    callback_args=callback_args,
+                    switches=switches,
+                    timeout=timeout,
+                )
+        finally:
+            for instruction in step_instructions:
+                # The netlists were already written by the runner, so the stepping
+                # instructions added above are taken out again, even if a run failed.
+                self.netlist.remove_instruction(instruction)
         if wait_completion:
             # Now waits for the simulations to end
             self.runner.wait_completion()
@@ -11,7 +11,7 @@ import subprocess
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path, PureWindowsPath
-from typing import Any, List, Optional, Type, Union
+from typing import Any, List, Optional, Set, Type, Union
 
 # -------------------------------------------------------------------------------
 #
@@ -34,6 +34,10 @@ from typing import Any, List, Optional, Type, Union
 
 _logger = logging.getLogger("cespy.Simulator")
 
+# Simulator executables that were already found in this process. Only positive
+# results are kept, so that a simulator installed later is still detected.
+_found_executables: Set[str] = set()
+
 if sys.version_info.major >= 3 and sys.version_info.minor >= 6:
 
     def run_function(
@@ -251,11 +255,14 @@ class Simulator(ABC):
         It will return a boolean value indicating if the simulator is installed or not.
         """
         if cls.spice_exe and len(cls.spice_exe) > 0:
-            # check if file exists
-            if Path(cls.spice_exe[0]).exists():
+            exe = cls.spice_exe[0]
+            # This is called before each simulation, so executables that were
+            # already found are not looked up on the file system again.
+            if exe in _found_executables:
                 return True
-            # check if file in path
-            if shutil.which(cls.spice_exe[0]):
+            # check if file exists or if file in path
+            if os.path.exists(exe) or shutil.which(exe):
+                _found_executables.add(exe)
                 return True
         return False
 
@@ -51,6 +51,9 @@ def detect_encoding(
 
     :rtype: str
     """
+    # The file is read only once, and then decoded with each candidate encoding
+    with open(file_path, "rb") as f:
+        raw_data = f.read()
     for encoding in (
         "utf-8",
         "utf-16",
@@ -61,9 +64,10 @@ def detect_encoding(
         "shift_jis",
     ):
         try:
-            with open(file_path, "r", encoding=encoding) as f:
-                lines = f.read()
-                f.seek(0)
+            # Universal newlines, as if the file was opened in text mode
+            lines = (
+                raw_data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+            )
         except UnicodeDecodeError:
             # This encoding didn't work, let's try again
             continue
@@ -60,11 +60,12 @@ def find_file_in_directory(directory: str, filename: str) -> Optional[str]:
     path, filename = os.path.split(filename)
     if path != "":
         directory = os.path.join(directory, path)
+    filename_lower = filename.lower()
     for root, _, files in os.walk(directory):
         # match case insensitive, but store the file system's file name, as the
         # file system may be case sensitive
         for filefound in files:
-            if filename.lower() == filefound.lower():
+            if filename_lower == filefound.lower():
                 return os.path.join(root, filefound)
     return None
 
@@ -89,6 +90,7 @@ def search_file_in_containers(filename: str, *containers: str) -> Optional[str]:
         >>> search_file_in_containers("model.lib", "/path/to/libs", "/path/to/archive.zip")
         '/path/to/libs/models/Model.lib'
     """
+    filename_lower = filename.lower()
     for container in containers:
         _logger.debug("Searching for '%s' in '%s'", filename, container)
         if os.path.exists(container):  # Skipping invalid paths
@@ -99,7 +101,7 @@ def search_file_in_containers(filename: str, *containers: str) -> Optional[str]:
                     for filefound in files:
                         # match case insensitive, but store the file system's file name,
                         # as the file system may be case sensitive
-                        if filename.lower() == filefound.lower():
+                        if filename_lower == filefound.lower():
                             temp_dir = os.path.join(".", "spice_lib_temp")
                             if not os.path.exists(temp_dir):
                                 os.makedirs(temp_dir)
@@ -101,10 +101,26 @@ class Sweep(BaseIterator):
         self.niter = 0
         return self
 
+    def __len__(self) -> int:
+        # Closed form estimate, corrected against the exact comparison done in
+        # __next__ so that floating point rounding doesn't give an off-by-one.
+        count = max(int(math.floor((self.stop - self.start) / self.step)) + 1, 0)
+        while count > 0 and not self._in_range(self.start + (count - 1) * self.step):
+            count -= 1
+        while self._in_range(self.start + count * self.step):
+            count += 1
+        return count
+
+    def _in_range(self, val: Union[int, float]) -> bool:
+        """Tells whether the value is still within the sweep limits."""
+        return (self.step > 0 and val <= self.stop) or (
+            self.step < 0 and val >= self.stop
+        )
+
     def __next__(self) -> Union[int, float]:
         val = self.start + self.niter * self.step
         self.niter += 1
-        if (self.step > 0 and val <= self.stop) or (self.step < 0 and val >= self.stop):
+        if self._in_range(val):
             return val
         self.finished = True
         raise StopIteration
@@ -211,6 +227,9 @@ class SweepLogN(BaseIterator):
         self.niter = 0
         return self
 
+    def __len__(self) -> int:
+        return int(self.stop)
+
     def __next__(self) -> Union[int, float]:
         if self.niter < self.stop:
             val = self.start * (self.step**self.niter)
@@ -24,11 +24,13 @@ def temp_dir(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def sample_netlist(test_files_dir: Path) -> Path:
+def sample_netlist(test_files_dir: Path, tmp_path: Path) -> Path:
     """Return path to a sample netlist file."""
     netlist = test_files_dir / "simple_rc.net"
     if not netlist.exists():
-        # Create a simple RC circuit netlist for testing
+        # Create a simple RC circuit netlist for testing. It goes to the test's
+        # temporary directory, so that the test files folder is left untouched.
+        netlist = tmp_path / "simple_rc.net"
         netlist.write_text(
             """* Simple RC Circuit
 V1 in 0 1
@@ -12,6 +12,14 @@ import psutil
 import os
 
 
+_PROCESS = psutil.Process(os.getpid())
+
+
+def sample_rss_mb() -> int:
+    """Return the resident set size of the test process in MB."""
+    return _PROCESS.memory_info().rss >> 20
+
+
 class TestRawFilePerformance:
     """Test performance of raw file operations."""
 
@@ -22,8 +30,7 @@ class TestRawFilePerformance:
         num_traces = 10
         
         # Measure memory before
-        process = psutil.Process(os.getpid())
-        mem_before = process.memory_info().rss / 1024 / 1024  # MB
+        mem_before = sample_rss_mb()
         
         # Generate data
         time_data = np.linspace(0, 1, num_points)
@@ -52,7 +59,7 @@ class TestRawFilePerformance:
         assert file_size_mb > 50  # Should be a substantial file
         
         # Memory usage check
-        mem_after = process.memory_info().rss / 1024 / 1024
+        mem_after = sample_rss_mb()
         mem_increase = mem_after - mem_before
         assert mem_increase < 1000  # Should not use more than 1GB additional memory
         
@@ -325,8 +332,6 @@ class TestMemoryUsage:
 
     def test_repeated_operations_memory(self, temp_dir: Path):
         """Test that repeated operations don't leak memory."""
-        process = psutil.Process(os.getpid())
-        
         # Create test netlist
         netlist_path = temp_dir / "memory_test.net"
         content = """* Memory Test
@@ -339,7 +344,7 @@ C1 out 0 1u
         netlist_path.write_text(content)
         
         # Get baseline memory
-        mem_baseline = process.memory_info().rss / 1024 / 1024
+        mem_baseline = sample_rss_mb()
         
         # Perform many operations
         for i in range(100):
@@ -364,7 +369,7 @@ C1 out 0 1u
             raw_file.unlink()
         
         # Check memory after operations
-        mem_after = process.memory_info().rss / 1024 / 1024
+        mem_after = sample_rss_mb()
         mem_increase = mem_after - mem_baseline
         
         # Should not have significant memory increase
@@ -0,0 +1 @@
+"""Unit tests for the client_server module."""
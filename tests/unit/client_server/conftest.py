@@ -0,0 +1,82 @@
+"""Fixtures for the client_server tests."""
+
+from pathlib import Path
+
+import pytest
+
+from cespy.sim.simulator import Simulator
+
+
+class FakeSimulator(Simulator):
+    """Simulator that only writes the raw and log files. The raw file is a copy of
+    the netlist, so that tests can tell which circuit was simulated."""
+
+    spice_exe = ["fake_spice"]
+    process_name = "fake_spice"
+
+    @classmethod
+    def run(
+        cls,
+        netlist_file,
+        cmd_line_switches=None,
+        timeout=None,
+        *,
+        stdout=None,
+        stderr=None,
+        exe_log=False,
+    ):
+        netlist = Path(netlist_file)
+        netlist.with_suffix(".raw").write_text(netlist.read_text())
+        netlist.with_suffix(".log").write_text("log")
+        return 0
+
+    @classmethod
+    def valid_switch(cls, switch, parameter=""):
+        return []
+
+    @classmethod
+    def create_netlist(
+        cls,
+        circuit_file,
+        cmd_line_switches=None,
+        timeout=None,
+        *,
+        stdout=None,
+        stderr=None,
+        exe_log=False,
+    ):
+        return Path(circuit_file)
+
+    @classmethod
+    def is_available(cls):
+        return True
+
+
+class FailingSimulator(FakeSimulator):
+    """Simulator whose simulations always fail, without writing a raw file."""
+
+    @classmethod
+    def run(
+        cls,
+        netlist_file,
+        cmd_line_switches=None,
+        timeout=None,
+        *,
+        stdout=None,
+        stderr=None,
+        exe_log=False,
+    ):
+        Path(netlist_file).with_suffix(".log").write_text("error")
+        return 1
+
+
+@pytest.fixture
+def fake_simulator():
+    """Simulator class that completes instantly, without any SPICE installed."""
+    return FakeSimulator
+
+
+@pytest.fixture
+def failing_simulator():
+    """Simulator class whose simulations always fail."""
+    return FailingSimulator
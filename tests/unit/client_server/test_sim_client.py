@@ -0,0 +1,149 @@
+"""Unit tests for SimClient class functionality."""
+
+import io
+import sys
+import zipfile
+from unittest.mock import patch
+from xmlrpc.client import Binary, Fault
+
+import pytest
+
+from cespy.client_server.sim_client import SimClient, SimClientInvalidRunId, main
+
+
+class TestSimClient:
+    """Test SimClient against a mocked XML-RPC server."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.patcher = patch("cespy.client_server.sim_client.ServerProxy")
+        self.server = self.patcher.start().return_value
+        self.server.start_session.return_value = "session"
+        self.client = SimClient("http://localhost", 9000)
+        self.client.minimum_time_between_server_calls = 0
+
+    def teardown_method(self):
+        """Stop patching the server proxy."""
+        self.patcher.stop()
+
+    def test_run_and_iterate(self, tmp_path):
+        """Test that all finished jobs are returned from a single status call."""
+        circuit = tmp_path / "circuit.net"
+        circuit.write_text("* test\n.end\n")
+        self.server.run.side_effect = [1, 2, 3]
+        run_ids = [self.client.run(circuit) for _ in range(3)]
+        assert run_ids == [1, 2, 3]
+
+        self.server.status.return_value = [1, 2, 3]
+        assert list(self.client) == [1, 2, 3]
+        self.server.status.assert_called_once_with("session")
+        assert list(self.client.stored_jobs) == [1, 2, 3]
+
+    def test_stored_jobs_are_not_returned_twice(self, tmp_path):
+        """Test that jobs not yet retrieved from the server are not reported again."""
+        circuit = tmp_path / "circuit.net"
+        circuit.write_text("* test\n.end\n")
+        self.server.run.side_effect = [1, 2]
+        self.client.run(circuit)
+        self.client.run(circuit)
+
+        self.server.status.side_effect = [[1], [1, 2]]
+        assert next(self.client) == 1
+        assert next(self.client) == 2
+        with pytest.raises(StopIteration):
+            next(self.client)
+
+    def test_run_skips_missing_dependencies(self, tmp_path):
+        """Test that the circuit and the existing dependencies are sent."""
+        circuit = tmp_path / "circuit.net"
+        circuit.write_text("* test\n.end\n")
+        library = tmp_path / "models.lib"
+        library.write_text("* models\n" * 1000)
+        stimulus = tmp_path / "stimulus.raw"
+        stimulus.write_bytes(bytes(8192))
+        self.server.run.return_value = 1
+
+        self.client.run(circuit, [library, stimulus, tmp_path / "missing.lib"])
+
+        session_id, circuit_name, zip_data = self.server.run.call_args[0]
+        assert (session_id, circuit_name) == ("session", "circuit.net")
+        with zipfile.ZipFile(io.BytesIO(zip_data)) as zip_file:
+            compression = {i.filename: i.compress_type for i in zip_file.infolist()}
+        assert compression == {
+            "circuit.net": zipfile.ZIP_STORED,
+            "models.lib": zipfile.ZIP_DEFLATED,
+            "stimulus.raw": zipfile.ZIP_STORED,
+        }
+
+    def test_run_missing_circuit(self, tmp_path):
+        """Test that a missing circuit isn't sent to the server."""
+        assert self.client.run(tmp_path / "missing.net") == -1
+        self.server.run.assert_not_called()
+
+    def test_run_skips_unreadable_dependencies(self, tmp_path):
+        """Test that a dependency that can't be read doesn't abort the upload."""
+        circuit = tmp_path / "circuit.net"
+        circuit.write_text("* test\n.end\n")
+        library = tmp_path / "models.lib"
+        library.write_text("* models\n")
+        self.server.run.return_value = 1
+        original_write = zipfile.ZipFile.write
+
+        def write(zip_file, filename, arcname=None, **kwargs):
+            if arcname == "models.lib":
+                raise PermissionError("Permission denied")
+            return original_write(zip_file, filename, arcname, **kwargs)
+
+        with patch.object(zipfile.ZipFile, "write", write):
+            assert self.client.run(circuit, [library]) == 1
+
+        zip_data = self.server.run.call_args[0][2]
+        with zipfile.ZipFile(io.BytesIO(zip_data)) as zip_file:
+            assert zip_file.namelist() == ["circuit.net"]
+
+    def test_run_missing_circuit_reads_no_dependencies(self, tmp_path):
+        """Test that the dependencies aren't read when the circuit is missing."""
+        library = tmp_path / "models.lib"
+        library.write_text("* models\n")
+
+        with patch.object(zipfile.ZipFile, "write") as mock_write:
+            assert self.client.run(tmp_path / "missing.net", [library]) == -1
+
+        mock_write.assert_not_called()
+        self.server.run.assert_not_called()
+
+    def test_run_directory_as_circuit(self, tmp_path):
+        """Test that a directory isn't sent to the server as a circuit."""
+        assert self.client.run(tmp_path) == -1
+        self.server.run.assert_not_called()
+
+    def test_get_runno_data_invalid(self):
+        """Test that asking for an unknown job raises an exception."""
+        with pytest.raises(SimClientInvalidRunId):
+            self.client.get_runno_data(42)
+
+    def test_context_manager_closes_session(self):
+        """Test that leaving the with block closes the session only once."""
+        with self.client as client:
+            assert client is self.client
+        self.client.close_session()
+        self.server.close_session.assert_called_once_with("session")
+
+    def test_main_continues_after_failed_simulation(self, tmp_path):
+        """Test that the CLI downloads the other results when one simulation fails."""
+        circuits = [tmp_path / "first.net", tmp_path / "second.net"]
+        for circuit in circuits:
+            circuit.write_text("* test\n.end\n")
+        self.server.run.side_effect = [1, 2]
+        self.server.status.return_value = [1, 2]
+        self.server.get_files.side_effect = [
+            Fault(1, "simulation failed"),
+            ("second_2.zip", Binary(b"results")),
+        ]
+
+        argv = ["sim_client", "localhost", "-r", *map(str, circuits)]
+        with patch.object(sys, "argv", argv), pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 1
+        assert (tmp_path / "second_2.zip").read_bytes() == b"results"
@@ -0,0 +1,164 @@
+"""Unit tests for SimServer class functionality."""
+
+import io
+import threading
+import time
+import zipfile
+from xmlrpc.client import Binary
+
+import pytest
+
+from cespy.client_server.sim_client import SimClient
+from cespy.client_server.sim_server import SimServer
+
+
+def _serve(tmp_path, simulator):
+    """Yield a server of simulator listening on a free port of localhost."""
+    sim_server = SimServer(
+        simulator, parallel_sims=2, output_folder=str(tmp_path / "server"), port=0
+    )
+    yield sim_server
+    sim_server.stop_server()
+    sim_server.server.server_close()
+    sim_server.server_thread.join(timeout=5)
+    sim_server.simulation_manager.join(timeout=5)
+
+
+@pytest.fixture
+def server(tmp_path, fake_simulator):
+    """A server listening on a free port of localhost."""
+    yield from _serve(tmp_path, fake_simulator)
+
+
+@pytest.fixture
+def failing_server(tmp_path, failing_simulator):
+    """A server whose simulations always fail."""
+    yield from _serve(tmp_path, failing_simulator)
+
+
+def _wait_until(condition, timeout=5.0):
+    """Poll condition until it is true or the timeout expires."""
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestSimServer:
+    """Test SimServer together with SimClient."""
+
+    def test_run_and_get_files(self, tmp_path, server):
+        """Test a full round trip of several simulations."""
+        port = server.server.server_address[1]
+        netlist = tmp_path / "circuit.net"
+        netlist.write_text("* test\n.end\n")
+
+        with SimClient("http://localhost", port) as client:
+            runnos = {client.run(netlist) for _ in range(3)}
+            received = {}
+            for runno in client:
+                received[runno] = client.get_runno_data(runno)
+            assert set(received) == runnos
+            for zip_path in received.values():
+                with zipfile.ZipFile(zip_path) as zip_file:
+                    assert len(zip_file.namelist()) == 2
+            # The files were erased on the server after the transfer
+            assert not server.simulation_manager.completed_tasks
+            assert server.get_files(client.session_id, min(runnos))[0] == ""
+        assert not server.sessions
+
+    def test_concurrent_sessions(self, server):
+        """Test that requests from several clients are served concurrently."""
+        port = server.server.server_address[1]
+        errors = []
+
+        def open_and_close_session():
+            try:
+                with SimClient("http://localhost", port) as client:
+                    assert server.status(client.session_id) == []
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                errors.append(exc)
+
+        threads = [threading.Thread(target=open_and_close_session) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        assert not errors
+        assert not server.sessions
+
+    def test_concurrent_runs(self, tmp_path, server):
+        """Test that concurrent runs get distinct runnos and keep their circuits."""
+        port = server.server.server_address[1]
+        results = {}
+        errors = []
+
+        def run_circuit(index):
+            # All the clients upload a circuit with the same name
+            netlist = tmp_path / f"client{index}" / "circuit.net"
+            netlist.parent.mkdir()
+            netlist.write_text(f"* client {index}\n.end\n")
+            try:
+                with SimClient("http://localhost", port) as client:
+                    runnos = [client.run(netlist) for _ in range(2)]
+                    for runno in client:
+                        zip_path = client.get_runno_data(runno)
+                        with zipfile.ZipFile(zip_path) as zip_file:
+                            raw_name = next(
+                                n for n in zip_file.namelist() if n.endswith(".raw")
+                            )
+                            results[runno] = (index, zip_file.read(raw_name))
+                    assert sorted(runnos) == sorted(
+                        runno for runno, (i, _) in results.items() if i == index
+                    )
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                errors.append(exc)
+
+        threads = [
+            threading.Thread(target=run_circuit, args=(index,), daemon=True)
+            for index in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        assert not errors
+        assert len(results) == 16
+        for index, raw_data in results.values():
+            assert raw_data == f"* client {index}\n.end\n".encode()
+
+    def test_failed_simulation(self, tmp_path, failing_server):
+        """Test that the files of a failed simulation are erased after the query."""
+        port = failing_server.server.server_address[1]
+        netlist = tmp_path / "circuit.net"
+        netlist.write_text("* test\n.end\n")
+
+        with SimClient("http://localhost", port) as client:
+            runno = client.run(netlist)
+            assert list(client) == [runno]
+            assert client.get_runno_data(runno) is None
+            assert not failing_server.simulation_manager.completed_tasks
+            assert client.session_id in failing_server.sessions
+        assert not failing_server.sessions
+
+    def test_run_after_session_closed(self, server):
+        """Test that a run of a session closed meanwhile is discarded."""
+        session_id = server.start_session()
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w") as zip_file:
+            zip_file.writestr("circuit.net", "* test\n.end\n")
+        manager = server.simulation_manager
+        add_simulation = manager.add_simulation
+
+        def add_and_close(*args, **kwargs):
+            runno = add_simulation(*args, **kwargs)
+            server.close_session(session_id)
+            return runno
+
+        manager.add_simulation = add_and_close
+        zip_data = Binary(zip_buffer.getvalue())
+        assert server.run(session_id, "circuit.net", zip_data) == -1
+        # The files are erased once the simulation completes
+        assert _wait_until(lambda: not manager._erase_on_completion)
+        assert not manager.completed_tasks
+        assert not server.sessions
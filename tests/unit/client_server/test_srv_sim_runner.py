@@ -0,0 +1,115 @@
+"""Unit tests for ServerSimRunner class functionality."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from cespy.client_server.srv_sim_runner import CompletedTask, ServerSimRunner
+
+
+class TestServerSimRunner:
+    """Test the bookkeeping of completed tasks on the server."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.patcher = patch("cespy.client_server.srv_sim_runner.SimRunner")
+        self.patcher.start()
+        self.manager = ServerSimRunner(parallel_sims=1)
+
+    def teardown_method(self):
+        """Stop patching the SimRunner."""
+        self.patcher.stop()
+
+    def add_completed(self, tmp_path, runno):
+        """Create the files of a completed task and register it."""
+        files = {}
+        for kind, suffix in (
+            ("circuit", ".net"),
+            ("raw", ".raw"),
+            ("log", ".log"),
+            ("zipfile", ".zip"),
+        ):
+            files[kind] = tmp_path / f"run_{runno}{suffix}"
+            files[kind].write_text(kind)
+        self.manager.completed_tasks[runno] = CompletedTask(
+            runno=runno, retcode=0, start=0.0, stop=1.0, **files
+        )
+        return files
+
+    def test_erase_files_of_runno(self, tmp_path):
+        """Test that only the files of the given run are deleted."""
+        files_1 = self.add_completed(tmp_path, 1)
+        files_2 = self.add_completed(tmp_path, 2)
+
+        self.manager.erase_files_of_runno(1)
+        self.manager.erase_files_of_runno(3)  # Erased once it completes
+
+        assert list(self.manager.completed_tasks) == [2]
+        assert not any(f.exists() for f in files_1.values())
+        assert all(f.exists() for f in files_2.values())
+
+    def test_cleanup_completed(self, tmp_path):
+        """Test that all the completed tasks and their files are removed."""
+        files = [self.add_completed(tmp_path, runno) for runno in (1, 2, 3)]
+        files[1]["raw"].unlink()  # A file that is already gone is ignored
+
+        self.manager.cleanup_completed()
+
+        assert not self.manager.completed_tasks
+        assert not list(tmp_path.iterdir())
+
+
+class TestServerSimRunnerThread:
+    """Test the ServerSimRunner thread with a fake simulator."""
+
+    def test_collects_finished_tasks_and_stops(self, tmp_path, fake_simulator):
+        """Test that finished simulations are collected and the thread stops."""
+        netlist = tmp_path / "circuit.net"
+        netlist.write_text("* test\n.end\n")
+        manager = ServerSimRunner(
+            parallel_sims=2, simulator=fake_simulator, output_folder=str(tmp_path)
+        )
+        manager.start()
+        try:
+            runnos = [manager.add_simulation(netlist) for _ in range(3)]
+            deadline = time.time() + 5
+            while len(manager.completed_tasks) < 3 and time.time() < deadline:
+                time.sleep(0.01)
+            assert sorted(manager.completed_tasks) == sorted(runnos)
+            assert all(t.zipfile.exists() for t in manager.completed_tasks.values())
+        finally:
+            manager.stop()
+            manager.join(timeout=5)
+        assert not manager.is_alive()
+        assert not manager.running()
+
+    def test_erase_before_completion(self, tmp_path, fake_simulator):
+        """Test that a run erased while running has its files deleted on completion."""
+        netlist = tmp_path / "circuit.net"
+        netlist.write_text("* test\n.end\n")
+        release = threading.Event()
+
+        class GatedSimulator(fake_simulator):
+            """Simulator that waits for the test before finishing."""
+
+            @classmethod
+            def run(cls, netlist_file, *args, **kwargs):
+                release.wait(timeout=5)
+                return super().run(netlist_file, *args, **kwargs)
+
+        manager = ServerSimRunner(
+            parallel_sims=1, simulator=GatedSimulator, output_folder=str(tmp_path)
+        )
+        manager.start()
+        try:
+            runno = manager.add_simulation(netlist)
+            manager.erase_files_of_runno(runno)
+            release.set()
+            deadline = time.time() + 5
+            while list(tmp_path.iterdir()) != [netlist] and time.time() < deadline:
+                time.sleep(0.01)
+            assert list(tmp_path.iterdir()) == [netlist]
+            assert not manager.completed_tasks
+        finally:
+            manager.stop()
+            manager.join(timeout=5)
@@ -60,6 +60,14 @@ class TestSpiceCircuit:
         netlist_str = str(circuit)
         assert ".ac dec 10 1 10k" in netlist_str
 
+    def test_has_instruction(self):
+        """Test looking up SPICE instructions."""
+        circuit = SpiceCircuit()
+        circuit.netlist = ["R1 in out 1k\n", ".step param res list 1 2\n"]
+
+        assert circuit.has_instruction(".step param res list 1 2")
+        assert not circuit.has_instruction(".step param res list 1 2 3")
+
 
 class TestSpiceEditor:
     """Test SpiceEditor functionality."""
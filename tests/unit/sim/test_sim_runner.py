@@ -1,5 +1,11 @@
 """Unit tests for SimRunner class functionality."""
 
+import asyncio
+import gc
+import inspect
+import threading
+import weakref
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, Mock
@@ -71,6 +77,25 @@ class TestSimRunner:
             assert isinstance(task, RunTask)
             assert task.netlist_file == self.test_netlist
 
+    @patch('cespy.simulators.ltspice_simulator.LTspice.run', return_value=0)
+    @patch('cespy.simulators.ltspice_simulator.LTspice.is_available', return_value=True)
+    def test_run_async(self, mock_available, mock_run, tmp_path):
+        """Test scheduling several simulations from an event loop."""
+        netlist = tmp_path / "async.net"
+        netlist.write_text("* test\n.end\n")
+
+        async def run_all():
+            return await asyncio.gather(
+                *(self.runner.run_async(netlist) for _ in range(3))
+            )
+
+        tasks = asyncio.run(run_all())
+
+        assert len(tasks) == 3
+        assert all(isinstance(task, RunTask) for task in tasks)
+        assert all(task.retcode == 0 for task in tasks)
+        assert mock_run.call_count == 3
+
     @patch('cespy.simulators.ltspice_simulator.LTspice.is_available', return_value=True)
     @patch('shutil.copy')
     def test_run_with_switches(self, mock_copy, mock_available):
@@ -201,6 +226,58 @@ class TestSimRunner:
             runner.__del__()
             mock_shutdown.assert_called()
 
+    def test_validate_callback_args_reuses_signature(self):
+        """Test that a callback signature is inspected only once."""
+        def callback(raw_file, log_file, gain):
+            return gain
+
+        with patch("cespy.sim.sim_runner.inspect.signature",
+                   wraps=inspect.signature) as mock_signature:
+            for gain in (1, 2, 3):
+                kwargs = SimRunner.validate_callback_args(callback, (gain,))
+                assert kwargs == {"gain": gain}
+
+        mock_signature.assert_called_once_with(callback)
+
+    def test_validate_callback_args_bound_method(self):
+        """Test that bound methods are validated without keeping their instance."""
+        class Processor:
+            def callback(self, raw_file, log_file, gain):
+                return gain
+
+        processor = Processor()
+        for _ in range(2):
+            kwargs = SimRunner.validate_callback_args(processor.callback, (5,))
+            assert kwargs == {"gain": 5}
+
+        processor_ref = weakref.ref(processor)
+        del processor
+        gc.collect()
+        assert processor_ref() is None
+
+    @patch('cespy.simulators.ltspice_simulator.LTspice.run', return_value=0)
+    @patch('cespy.simulators.ltspice_simulator.LTspice.is_available', return_value=True)
+    def test_run_from_several_threads(self, mock_available, mock_run, tmp_path):
+        """Test that concurrent run() calls get distinct run numbers."""
+        netlist = tmp_path / "threads.net"
+        netlist.write_text("* test\n.end\n")
+        runner = SimRunner(parallel_sims=4, output_folder=str(tmp_path / "out"))
+        tasks = []
+
+        def submit():
+            tasks.append(runner.run(netlist, wait_resource=False))
+
+        threads = [threading.Thread(target=submit) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert runner.wait_completion(timeout=10)
+
+        assert sorted(task.runno for task in tasks) == list(range(1, 17))
+        assert len(runner.tasks.completed_tasks) == 16
+        assert runner.ok_sim == 16
+
     def test_parallel_simulation_limit(self):
         """Test that parallel simulation limit is respected."""
         runner = SimRunner(parallel_sims=1)  # Limit to 1 simulation
@@ -0,0 +1,90 @@
+"""Unit tests for SimStepper class functionality."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from cespy.sim.sim_stepping import SimStepper
+
+
+class TestSimStepper:
+    """Test SimStepper sweep generation."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.netlist = MagicMock()
+        self.netlist.has_instruction.return_value = False
+        self.runner = MagicMock()
+        self.stepper = SimStepper(self.netlist, self.runner)
+
+    def test_run_all_covers_cartesian_product(self):
+        """Test that every combination of the sweeps is simulated."""
+        self.stepper.add_param_sweep("res", [1, 2, 3])
+        self.stepper.add_value_sweep("C1", ["1n", "2n"])
+
+        self.stepper.run_all()
+
+        assert self.runner.run.call_count == 6
+        assert self.stepper.total_number_of_simulations() == 6
+        self.runner.wait_completion.assert_called_once()
+
+    def test_run_all_only_updates_changed_dimensions(self):
+        """Test that the outer dimension is only set when it advances."""
+        self.stepper.add_param_sweep("res", [1, 2])
+        self.stepper.add_value_sweep("C1", ["1n", "2n", "3n"])
+
+        self.stepper.run_all(wait_completion=False)
+
+        assert self.netlist.set_parameter.call_count == 2
+        assert self.netlist.set_component_value.call_count == 6
+        self.runner.wait_completion.assert_not_called()
+
+    def test_run_all_empty_sweep(self):
+        """Test that an empty dimension results in no simulations."""
+        self.stepper.add_param_sweep("res", [1, 2])
+        self.stepper.add_param_sweep("temp", [])
+
+        self.stepper.run_all()
+
+        self.runner.run.assert_not_called()
+
+    def test_run_all_native_step(self):
+        """Test that parameter sweeps can be delegated to a .step instruction."""
+        self.stepper.add_param_sweep("res", [1, 2, 3])
+        self.stepper.add_value_sweep("C1", ["1n", "2n"])
+
+        self.stepper.run_all(native_step=True)
+
+        assert self.runner.run.call_count == 2
+        self.netlist.set_parameter.assert_not_called()
+        self.netlist.add_instructions.assert_called_once_with(
+            ".step param res list 1 2 3"
+        )
+        self.netlist.remove_instruction.assert_called_once_with(
+            ".step param res list 1 2 3"
+        )
+
+    def test_run_all_native_step_cleans_up_on_error(self):
+        """Test that the .step instruction is removed when a run fails."""
+        self.stepper.add_param_sweep("res", [1, 2])
+        self.runner.run.side_effect = RuntimeError("simulator failure")
+
+        with pytest.raises(RuntimeError):
+            self.stepper.run_all(native_step=True)
+
+        self.netlist.remove_instruction.assert_called_once_with(
+            ".step param res list 1 2"
+        )
+
+    def test_run_all_native_step_keeps_existing_instruction(self):
+        """Test that a .step instruction already in the netlist is left in place."""
+        self.stepper.add_param_sweep("res", [1, 2])
+        self.netlist.has_instruction.return_value = True
+
+        self.stepper.run_all(native_step=True)
+
+        self.netlist.has_instruction.assert_called_once_with(
+            ".step param res list 1 2"
+        )
+        self.netlist.add_instructions.assert_called_once_with()
+        self.netlist.remove_instruction.assert_not_called()
@@ -0,0 +1,29 @@
+"""Unit tests for the detect_encoding function."""
+
+import pytest
+
+from cespy.utils.detect_encoding import EncodingDetectError, detect_encoding
+
+
+class TestDetectEncoding:
+    """Test encoding detection on files written with known encodings."""
+
+    def test_utf8(self, tmp_path):
+        """Test that a plain text file is detected as utf-8."""
+        file_path = tmp_path / "utf8.log"
+        file_path.write_bytes("Circuit: * Test\r\nDate: 2024\r\n".encode("utf-8"))
+        assert detect_encoding(file_path) == "utf-8"
+
+    def test_utf16_le_without_bom(self, tmp_path):
+        """Test that a utf-16 file without BOM is not taken for utf-8."""
+        file_path = tmp_path / "utf16.log"
+        file_path.write_bytes("Circuit: * Test\r\n".encode("utf_16_le"))
+        assert detect_encoding(file_path) != "utf-8"
+
+    def test_expected_pattern(self, tmp_path):
+        """Test that the expected pattern is searched at the start of any line."""
+        file_path = tmp_path / "pattern.log"
+        file_path.write_bytes("first line\r\nCircuit: * Test\r\n".encode("utf-16"))
+        assert detect_encoding(file_path, r"^Circuit: \*") == "utf-16"
+        with pytest.raises(EncodingDetectError):
+            detect_encoding(file_path, r"^Netlist")
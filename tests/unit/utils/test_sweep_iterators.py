@@ -168,4 +168,11 @@ class TestSweepIterators:
         assert callable(sweep)
         assert callable(sweep_n)
         assert callable(sweep_log)
-        assert callable(sweep_log_n)
\ No newline at end of file
+        assert callable(sweep_log_n)
+
+    def test_sweep_len_matches_iteration(self):
+        """Test that len() agrees with the number of generated points."""
+        for args in ((0.3, 1.1, 0.2), (15, -15, 2.5), (0, 10, 3), (0, 1, 0.1)):
+            assert len(sweep(*args)) == len(list(sweep(*args)))
+        assert len(sweep_n(0.3, 1.1, 5)) == 5
+        assert len(sweep_log_n(1, 10, 6)) == 6